@@ -1,76 +1,259 @@
 import os
+import re
+import csv
+import array
+import operator
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import tempfile
+import uuid
 import sqlite3
 import pandas as pd
 import numpy as np
 from pymavlink import mavutil
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Iterator, Callable
 import logging
 from pathlib import Path
 
+# Optional JIT compilation for numeric kernels
+try:
+    import numba
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Parallel kernels run from several Streamlit script threads at once; numba's
+# TBB layer can hang shutdown there and workqueue aborts, so pin OpenMP
+NUMBA_PARALLEL = False
+if NUMBA_AVAILABLE:
+    try:
+        import numba.np.ufunc.omppool  # noqa: F401
+        numba.config.THREADING_LAYER = 'omp'
+        NUMBA_PARALLEL = True
+    except (ImportError, OSError):
+        pass
+
+# Optional in-memory Arrow hand-off from the parser
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def parse_all_mavlink_messages_to_csv(log_file_path: str, output_dir: str) -> Dict[str, str]:
+# Rows buffered per message type before each executemany call
+SQLITE_BATCH_SIZE = 10_000
+
+# Rows sampled from each CSV file to pick column types
+CSV_TYPE_SNIFF_ROWS = 100
+
+# MAVLink wire types mapped to SQLite column types
+MAVLINK_SQLITE_TYPES = {
+    'float': 'REAL',
+    'double': 'REAL',
+    'char': 'TEXT',
+    'int8_t': 'INTEGER',
+    'uint8_t': 'INTEGER',
+    'uint8_t_mavlink_version': 'INTEGER',
+    'int16_t': 'INTEGER',
+    'uint16_t': 'INTEGER',
+    'int32_t': 'INTEGER',
+    'uint32_t': 'INTEGER',
+    'int64_t': 'INTEGER',
+    'uint64_t': 'INTEGER',
+}
+
+# Largest value a SQLite INTEGER holds; larger uint64 values are stored as REAL
+SQLITE_MAX_INTEGER = 2**63 - 1
+
+# Declared column types written by the loaders
+SQLITE_DECLARED_TYPES = ('INTEGER', 'REAL', 'TEXT')
+
+# Bulk-load settings; page_size must be set before the first table is created.
+# The rollback journal stays (in memory) so a failed table load can be undone.
+SQLITE_BULK_LOAD_PRAGMAS = """
+    PRAGMA page_size=65536;
+    PRAGMA journal_mode=MEMORY;
+    PRAGMA synchronous=OFF;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA locking_mode=EXCLUSIVE;
+    PRAGMA cache_size=-262144;
+"""
+
+# Settings for connections that only query a loaded database
+SQLITE_READ_PRAGMAS = """
+    PRAGMA query_only=1;
+    PRAGMA temp_store=MEMORY;
+"""
+
+# MAVLink wire types mapped to array.array/NumPy typecodes of the same width
+MAVLINK_ARRAY_TYPECODES = {
+    'float': 'f',
+    'double': 'd',
+    'int8_t': 'b',
+    'uint8_t': 'B',
+    'uint8_t_mavlink_version': 'B',
+    'int16_t': 'h',
+    'uint16_t': 'H',
+    'int32_t': 'i',
+    'uint32_t': 'I',
+    'int64_t': 'q',
+    'uint64_t': 'Q',
+}
+
+# DataFlash format characters mapped to array.array/NumPy typecodes;
+# scaled fields (c, C, e, E, L) are stored as float64 to keep their precision
+DATAFLASH_ARRAY_TYPECODES = {
+    'b': 'b',
+    'B': 'B',
+    'M': 'b',
+    'h': 'h',
+    'H': 'H',
+    'i': 'i',
+    'I': 'I',
+    'q': 'q',
+    'Q': 'Q',
+    'f': 'f',
+    'g': 'f',
+    'd': 'd',
+    'c': 'd',
+    'C': 'd',
+    'e': 'd',
+    'E': 'd',
+    'L': 'd',
+}
+
+# DataFlash field value types mapped to SQLite column types
+DATAFLASH_SQLITE_TYPES = {
+    int: 'INTEGER',
+    float: 'REAL',
+    str: 'TEXT',
+}
+
+def iter_mavlink_messages(log_file_path: str) -> Iterator[Tuple[str, Any]]:
+    """
+    Iterate over valid messages in a MAVLink log file.
+    Yields (message_type, message) tuples.
+    """
+    # Connect to MAVLink log
+    mlog = mavutil.mavlink_connection(log_file_path)
+    
+    # Pull messages straight from the parser, bypassing recv_match's type/condition filtering
+    while True:
+        msg = mlog.recv_msg()
+        if msg is None:
+            break
+            
+        msg_type = msg.get_type()
+        
+        # Skip invalid message types
+        if msg_type in ['BAD_DATA', 'UNKNOWN']:
+            continue
+        
+        yield msg_type, msg
+
+def get_message_fieldnames(msg: Any) -> List[str]:
+    """
+    Get the field names of a MAVLink or DataFlash message.
+    """
+    if hasattr(msg, '_fieldnames'):
+        return list(msg._fieldnames)
+    
+    # Fallback: extract from message dict
+    return [k for k in msg.to_dict().keys() if k != 'mavpackettype']
+
+def make_row_getter(fieldnames: List[str]) -> Callable[[Any], Tuple]:
+    """
+    Build a getter that reads all fields of a message into a tuple in one call.
+    """
+    if not fieldnames:
+        return lambda msg: ()
+    if len(fieldnames) == 1:
+        getter = operator.attrgetter(fieldnames[0])
+        return lambda msg: (getter(msg),)
+    return operator.attrgetter(*fieldnames)
+
+def parse_all_mavlink_messages_to_csv(log_file_path: str, output_dir: Optional[str] = None,
+                                      sink: str = 'csv',
+                                      conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
     """
     Parse MAVLink log file and save each message type to separate CSV files.
     Returns dictionary mapping message types to their CSV file paths.
+    
+    sink='sqlite' writes rows straight into conn and returns row counts per table;
+    sink='arrow' returns a pyarrow Table per message type without touching disk;
+    sink='parquet' writes {msg_type}.parquet files instead of CSVs.
     """
+    if sink == 'sqlite':
+        if conn is None:
+            raise ValueError("sink='sqlite' requires a database connection")
+        return parse_mavlink_to_sqlite(log_file_path, conn)
+    if sink == 'arrow':
+        return parse_mavlink_to_arrow(log_file_path)
+    if sink == 'parquet':
+        return parse_all_mavlink_messages_to_parquet(log_file_path, output_dir)
+    if sink != 'csv':
+        raise ValueError(f"Unknown sink: {sink}")
+    if output_dir is None:
+        raise ValueError("sink='csv' requires an output directory")
+    
     try:
-        # Connect to MAVLink log
-        mlog = mavutil.mavlink_connection(log_file_path)
-        
         message_writers = {}
-        message_files = {}
+        message_columns = {}
         
         logger.info(f"Parsing MAVLink log: {log_file_path}")
         
-        while True:
-            msg = mlog.recv_match(blocking=False)
-            if msg is None:
-                break
-                
-            msg_type = msg.get_type()
-            
-            # Skip invalid message types
-            if msg_type in ['BAD_DATA', 'UNKNOWN']:
-                continue
-                
-            # Initialize CSV writer for new message type
-            if msg_type not in message_writers:
+        for msg_type, msg in iter_mavlink_messages(log_file_path):
+            # Initialize column buffers for new message type
+            entry = message_columns.get(msg_type)
+            if entry is None:
                 csv_path = os.path.join(output_dir, f"{msg_type}.csv")
                 
                 # Get message fields
-                if hasattr(msg, '_fieldnames'):
-                    fieldnames = msg._fieldnames
-                else:
-                    # Fallback: extract from message dict
-                    fieldnames = list(msg.to_dict().keys())
+                fieldnames = get_message_fieldnames(msg)
                 
-                # Create CSV file
-                df_empty = pd.DataFrame(columns=fieldnames)
-                df_empty.to_csv(csv_path, index=False)
+                # One typed buffer per numeric field, plain lists otherwise
+                entry = {
+                    'cols': fieldnames,
+                    'get_row': make_row_getter(fieldnames),
+                    'buffers': [array.array(code) if code else []
+                                for code in get_field_metadata(msg, fieldnames)['typecodes']]
+                }
                 
                 message_writers[msg_type] = csv_path
-                message_files[msg_type] = []
+                message_columns[msg_type] = entry
                 
                 logger.info(f"Created CSV for message type: {msg_type}")
             
-            # Convert message to dictionary
+            # Read message fields
             try:
-                msg_dict = msg.to_dict()
-                message_files[msg_type].append(msg_dict)
+                row = entry['get_row'](msg)
             except Exception as e:
                 logger.warning(f"Failed to convert message {msg_type}: {e}")
                 continue
+            
+            for i, val in enumerate(row):
+                append_column_value(entry['buffers'], i, val)
                 
-        # Write accumulated messages to CSV files
-        for msg_type, records in message_files.items():
-            if records:
-                csv_path = message_writers[msg_type]
-                df = pd.DataFrame(records)
-                df.to_csv(csv_path, index=False)
-                logger.info(f"Wrote {len(records)} records to {msg_type}.csv")
+        # Write accumulated columns to CSV files
+        for msg_type, entry in message_columns.items():
+            columns = {'mavpackettype': msg_type}
+            for f, buf in zip(entry['cols'], entry['buffers']):
+                if isinstance(buf, array.array):
+                    columns[f] = np.frombuffer(buf, dtype=buf.typecode)
+                else:
+                    columns[f] = buf
+            
+            df = pd.DataFrame(columns)
+            df.to_csv(message_writers[msg_type], index=False)
+            logger.info(f"Wrote {len(df)} records to {msg_type}.csv")
         
         return message_writers
         
@@ -78,39 +261,599 @@ def parse_all_mavlink_messages_to_csv(log_file_path: str, output_dir: str) -> Di
         logger.error(f"Error parsing MAVLink log: {e}")
         raise
 
+def clean_table_name(msg_type: str) -> str:
+    """
+    Clean a message type name for use as an SQLite table name.
+    """
+    return msg_type.replace('-', '_').replace(' ', '_')
+
+def get_field_metadata(msg: Any, fieldnames: List[str]) -> Dict[str, List[Any]]:
+    """
+    Describe each field of a MAVLink or DataFlash message from its wire format.
+    Returns per-field lists: 'sqlite_types', 'typecodes' (array.array typecode, or
+    None where a plain list is needed) and the indices of 'array_cols' (stored as
+    TEXT) and 'uint64_cols' (which can exceed SQLite's signed INTEGER range).
+    """
+    n_fields = len(fieldnames)
+    
+    # MAVLink messages carry their wire types (array lengths are in wire order)
+    if hasattr(msg, 'fieldtypes') and len(msg.fieldtypes) == n_fields:
+        orders = getattr(msg, 'orders', None) or list(range(n_fields))
+        lengths = getattr(msg, 'array_lengths', None) or [0] * n_fields
+        
+        meta = {'sqlite_types': [], 'typecodes': [], 'array_cols': [], 'uint64_cols': []}
+        for i, field_type in enumerate(msg.fieldtypes):
+            is_sequence = bool(lengths[orders[i]])
+            # char arrays are strings; every other array is stringified
+            if is_sequence and field_type != 'char':
+                meta['sqlite_types'].append('TEXT')
+                meta['array_cols'].append(i)
+            else:
+                meta['sqlite_types'].append(MAVLINK_SQLITE_TYPES.get(field_type, 'TEXT'))
+            meta['typecodes'].append(None if is_sequence else MAVLINK_ARRAY_TYPECODES.get(field_type))
+            if field_type == 'uint64_t' and not is_sequence:
+                meta['uint64_cols'].append(i)
+        return meta
+    
+    # DataFlash messages carry struct format characters and Python value types
+    fmt = getattr(msg, 'fmt', None)
+    if fmt is not None and len(getattr(fmt, 'msg_fmts', [])) == n_fields:
+        array_cols = [i for i, value_type in enumerate(fmt.msg_types)
+                      if value_type not in DATAFLASH_SQLITE_TYPES]
+        return {
+            'sqlite_types': [DATAFLASH_SQLITE_TYPES.get(value_type, 'TEXT')
+                             for value_type in fmt.msg_types],
+            'typecodes': [DATAFLASH_ARRAY_TYPECODES.get(fmt_char) for fmt_char in fmt.msg_fmts],
+            'array_cols': array_cols,
+            'uint64_cols': [i for i, fmt_char in enumerate(fmt.msg_fmts) if fmt_char == 'Q'],
+        }
+    
+    # Unknown message class: untyped columns in plain lists
+    return {
+        'sqlite_types': [''] * n_fields,
+        'typecodes': [None] * n_fields,
+        'array_cols': [],
+        'uint64_cols': [],
+    }
+
+def append_column_value(buffers: List[Any], i: int, val: Any) -> None:
+    """
+    Append a value to column buffer i. A typed buffer that cannot hold the value
+    (missing, or a DataFlash format redefined with another type) becomes a list.
+    """
+    try:
+        buffers[i].append(val)
+    except (TypeError, OverflowError):
+        buffers[i] = buffers[i].tolist()
+        buffers[i].append(val)
+
+def drop_failed_table(cursor: sqlite3.Cursor, entry: Dict[str, Any],
+                      row_counts: Dict[str, int], error: Exception) -> None:
+    """
+    Give up on one message type after a failed write, keeping the rest of the load.
+    """
+    logger.warning(f"Failed to load {entry['msg_type']}: {error}")
+    entry['failed'] = True
+    entry['buf'].clear()
+    row_counts.pop(entry['table'], None)
+    try:
+        cursor.execute(f"DROP TABLE IF EXISTS [{entry['table']}]")
+    except sqlite3.Error as e:
+        logger.warning(f"Could not drop partial table {entry['table']}: {e}")
+
+class LogDatabaseConnection(sqlite3.Connection):
+    """
+    SQLite connection holding a parsed log, with a memo table for read-only queries
+    and the row counts recorded by the loaders.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.query_cache = {}
+        self.row_counts = {}
+    
+    def close(self):
+        self.query_cache.clear()
+        super().close()
+
+def cached_per_connection(func: Callable) -> Callable:
+    """
+    Memoize a query helper per connection and arguments.
+    Only LogDatabaseConnection carries a cache; other connections run uncached.
+    """
+    @functools.wraps(func)
+    def wrapper(conn, *args, **kwargs):
+        cache = getattr(conn, 'query_cache', None)
+        if cache is None:
+            return func(conn, *args, **kwargs)
+        
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            cache[key] = func(conn, *args, **kwargs)
+        return cache[key]
+    
+    return wrapper
+
+def clear_connection_cache(conn: sqlite3.Connection) -> None:
+    """
+    Drop memoized query results after the database has been written to.
+    """
+    cache = getattr(conn, 'query_cache', None)
+    if cache is not None:
+        cache.clear()
+
+def record_row_counts(conn: sqlite3.Connection, row_counts: Dict[str, int]) -> None:
+    """
+    Remember how many rows the loader inserted per table, if the connection allows.
+    """
+    known_counts = getattr(conn, 'row_counts', None)
+    if known_counts is not None:
+        known_counts.update(row_counts)
+
+def create_temp_db() -> sqlite3.Connection:
+    """
+    Create the in-memory SQLite database that holds the parsed log.
+    The database is a named shared-cache one (see conn.uri), so read-only
+    connections can be opened on it later; it lives while any of them is open.
+    The connection is tuned for a one-off bulk load before any writes.
+    """
+    uri = f"file:mavlog_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=LogDatabaseConnection)
+    conn.uri = uri
+    conn.executescript(SQLITE_BULK_LOAD_PRAGMAS)
+    return conn
+
+def open_readonly_db(uri: str, row_counts: Optional[Dict[str, int]] = None) -> sqlite3.Connection:
+    """
+    Open a read-only connection on a database made by create_temp_db, usable from any thread.
+    Pass the loader's row counts (conn.row_counts) to skip COUNT(*) queries.
+    """
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False, factory=LogDatabaseConnection)
+    conn.uri = uri
+    conn.executescript(SQLITE_READ_PRAGMAS)
+    if row_counts:
+        record_row_counts(conn, row_counts)
+    return conn
+
+def parse_mavlink_to_sqlite(log_file_path: str, conn: sqlite3.Connection) -> Dict[str, int]:
+    """
+    Parse MAVLink log file straight into SQLite, one table per message type.
+    Rows are inserted with batched executemany calls inside a single transaction.
+    A message type whose rows cannot be written is dropped and the load carries on.
+    Returns dictionary mapping table names to their inserted row counts.
+    """
+    try:
+        cursor = conn.cursor()
+        per_type = {}
+        row_counts = {}
+        
+        logger.info(f"Parsing MAVLink log into database: {log_file_path}")
+        
+        conn.execute('BEGIN')
+        
+        for msg_type, msg in iter_mavlink_messages(log_file_path):
+            # Create table and insert statement for new message type
+            entry = per_type.get(msg_type)
+            if entry is None:
+                fieldnames = get_message_fieldnames(msg)
+                
+                table_name = clean_table_name(msg_type)
+                meta = get_field_metadata(msg, fieldnames)
+                column_defs = ', '.join(f'[{col}] {col_type}'.rstrip()
+                                        for col, col_type in zip(fieldnames, meta['sqlite_types']))
+                
+                entry = {
+                    'msg_type': msg_type,
+                    'table': table_name,
+                    'cols': fieldnames,
+                    'get_row': make_row_getter(fieldnames),
+                    'array_cols': meta['array_cols'],
+                    'uint64_cols': meta['uint64_cols'],
+                    'insert_sql': f"INSERT INTO [{table_name}] VALUES ({', '.join('?' * len(fieldnames))})",
+                    'buf': [],
+                    'failed': False
+                }
+                per_type[msg_type] = entry
+                row_counts[table_name] = 0
+                
+                try:
+                    cursor.execute(f"CREATE TABLE [{table_name}] ({column_defs})")
+                    logger.info(f"Created table for message type: {msg_type}")
+                except Exception as e:
+                    drop_failed_table(cursor, entry, row_counts, e)
+            
+            if entry['failed']:
+                continue
+            
+            # Read fields straight off the message
+            try:
+                row = entry['get_row'](msg)
+            except AttributeError:
+                row = tuple(getattr(msg, f, None) for f in entry['cols'])
+            
+            if entry['array_cols'] or entry['uint64_cols']:
+                row = list(row)
+                for i in entry['array_cols']:
+                    if row[i] is not None:
+                        row[i] = str(list(row[i]))
+                # SQLite cannot bind integers above 2**63 - 1
+                for i in entry['uint64_cols']:
+                    if row[i] is not None and row[i] > SQLITE_MAX_INTEGER:
+                        row[i] = float(row[i])
+            
+            buf = entry['buf']
+            buf.append(row)
+            if len(buf) >= SQLITE_BATCH_SIZE:
+                try:
+                    cursor.executemany(entry['insert_sql'], buf)
+                    row_counts[entry['table']] += len(buf)
+                    buf.clear()
+                except Exception as e:
+                    drop_failed_table(cursor, entry, row_counts, e)
+        
+        # Flush remaining rows
+        for entry in per_type.values():
+            if entry['failed']:
+                continue
+            if entry['buf']:
+                try:
+                    cursor.executemany(entry['insert_sql'], entry['buf'])
+                    row_counts[entry['table']] += len(entry['buf'])
+                    entry['buf'].clear()
+                except Exception as e:
+                    drop_failed_table(cursor, entry, row_counts, e)
+                    continue
+            logger.info(f"Loaded {row_counts[entry['table']]} records into table: {entry['table']}")
+        
+        conn.commit()
+        record_row_counts(conn, row_counts)
+        clear_connection_cache(conn)
+        create_time_indexes(conn, list(row_counts))
+        
+        return row_counts
+        
+    except Exception as e:
+        if conn.in_transaction:
+            conn.rollback()
+        logger.error(f"Error parsing MAVLink log into database: {e}")
+        raise
+
+def parse_mavlink_to_arrow(log_file_path: str) -> Dict[str, Any]:
+    """
+    Parse MAVLink log file into one in-memory pyarrow Table per message type.
+    Returns dictionary mapping message types to their Tables.
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for sink='arrow'")
+    
+    try:
+        per_type = {}
+        
+        logger.info(f"Parsing MAVLink log into Arrow tables: {log_file_path}")
+        
+        for msg_type, msg in iter_mavlink_messages(log_file_path):
+            # Start one typed buffer per numeric field, plain lists for text and arrays
+            entry = per_type.get(msg_type)
+            if entry is None:
+                fieldnames = get_message_fieldnames(msg)
+                meta = get_field_metadata(msg, fieldnames)
+                entry = {
+                    'cols': fieldnames,
+                    'get_row': make_row_getter(fieldnames),
+                    'array_cols': set(meta['array_cols']),
+                    'values': [array.array(code) if code else [] for code in meta['typecodes']]
+                }
+                per_type[msg_type] = entry
+            
+            try:
+                row = entry['get_row'](msg)
+            except AttributeError:
+                row = tuple(getattr(msg, f, None) for f in entry['cols'])
+            
+            for i, val in enumerate(row):
+                if i in entry['array_cols'] and val is not None:
+                    val = str(list(val))
+                append_column_value(entry['values'], i, val)
+        
+        tables = {}
+        for msg_type, entry in per_type.items():
+            tables[msg_type] = pa.table({
+                f: pa.array(np.frombuffer(values, dtype=values.typecode))
+                if isinstance(values, array.array) else pa.array(values)
+                for f, values in zip(entry['cols'], entry['values'])
+            })
+            logger.info(f"Built Arrow table with {tables[msg_type].num_rows} records for {msg_type}")
+        
+        return tables
+        
+    except Exception as e:
+        logger.error(f"Error parsing MAVLink log into Arrow tables: {e}")
+        raise
+
+def parse_all_mavlink_messages_to_parquet(log_file_path: str, output_dir: str) -> Dict[str, str]:
+    """
+    Parse MAVLink log file and save each message type to a zstd-compressed Parquet file.
+    Columns keep their parsed types, so loading them back needs no type sniffing.
+    Returns dictionary mapping message types to their Parquet file paths.
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for sink='parquet'")
+    if output_dir is None:
+        raise ValueError("sink='parquet' requires an output directory")
+    
+    parquet_files = {}
+    for msg_type, table in parse_mavlink_to_arrow(log_file_path).items():
+        parquet_path = os.path.join(output_dir, f"{msg_type}.parquet")
+        pq.write_table(table, parquet_path, compression='zstd')
+        parquet_files[msg_type] = parquet_path
+        logger.info(f"Saved {table.num_rows} records for {msg_type}")
+    
+    return parquet_files
+
+def load_mavlink_to_temp_db(log_file_path: str) -> sqlite3.Connection:
+    """
+    Parse MAVLink log file into a temporary SQLite database without CSV files.
+    Returns the database connection.
+    """
+    conn = create_temp_db()
+    parse_mavlink_to_sqlite(log_file_path, conn)
+    return conn
+
+def sniff_sqlite_column_types(sample_rows: List[List[str]], n_columns: int) -> List[str]:
+    """
+    Guess SQLite column types (INTEGER/REAL/TEXT) from a sample of CSV rows.
+    Columns with no values in the sample are left untyped.
+    """
+    column_types = []
+    
+    for i in range(n_columns):
+        values = [row[i] for row in sample_rows if i < len(row) and row[i] != '']
+        if not values:
+            column_types.append('')
+            continue
+        
+        col_type = 'INTEGER'
+        for val in values:
+            if col_type == 'INTEGER':
+                try:
+                    int(val)
+                    continue
+                except ValueError:
+                    col_type = 'REAL'
+            try:
+                float(val)
+            except ValueError:
+                col_type = 'TEXT'
+                break
+        
+        column_types.append(col_type)
+    
+    return column_types
+
+def write_table_batches(conn: sqlite3.Connection, table_name: str, column_defs: str,
+                        insert_sql: str, batches: Iterator[Iterator[Any]]) -> int:
+    """
+    Recreate a table and fill it from row batches inside one transaction;
+    if any batch fails, the rollback restores the previous table (or none).
+    Batches may be lazy row iterators. Returns the number of rows inserted.
+    """
+    cursor = conn.cursor()
+    conn.execute('BEGIN')
+    try:
+        cursor.execute(f"DROP TABLE IF EXISTS [{table_name}]")
+        cursor.execute(f"CREATE TABLE [{table_name}] ({column_defs})")
+        
+        row_count = 0
+        for batch in batches:
+            cursor.executemany(insert_sql, batch)
+            row_count += cursor.rowcount
+        
+        conn.commit()
+        record_row_counts(conn, {table_name: row_count})
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        clear_connection_cache(conn)
+    
+    return row_count
+
+def load_csv_to_table(conn: sqlite3.Connection, csv_path: str, table_name: str) -> int:
+    """
+    Load one CSV file into a typed SQLite table using batched executemany.
+    Parquet files (by extension) are loaded through pyarrow without parsing text.
+    Returns the number of rows inserted.
+    """
+    if csv_path.endswith('.parquet'):
+        return load_parquet_to_table(conn, csv_path, table_name)
+    if PYARROW_AVAILABLE:
+        return load_csv_to_table_with_pyarrow(conn, csv_path, table_name)
+    
+    with open(csv_path, newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return 0
+        
+        # Pick column types from the first rows
+        sample = list(itertools.islice(reader, CSV_TYPE_SNIFF_ROWS))
+        if not sample:
+            return 0
+        column_types = sniff_sqlite_column_types(sample, len(header))
+        
+        column_defs = ', '.join(f'[{col}] {col_type}'.rstrip()
+                                for col, col_type in zip(header, column_types))
+        # Empty CSV cells become NULL; column affinity converts numeric text
+        placeholders = ', '.join(["NULLIF(?, '')"] * len(header))
+        insert_sql = f"INSERT INTO [{table_name}] VALUES ({placeholders})"
+        
+        batches = itertools.chain(
+            [sample],
+            iter(lambda: list(itertools.islice(reader, SQLITE_BATCH_SIZE)), [])
+        )
+        return write_table_batches(conn, table_name, column_defs, insert_sql, batches)
+
+def load_csv_to_table_with_pyarrow(conn: sqlite3.Connection, csv_path: str, table_name: str) -> int:
+    """
+    Load one CSV file with pyarrow's multi-threaded reader into a typed SQLite table.
+    Returns the number of rows inserted.
+    """
+    table = pacsv.read_csv(
+        csv_path,
+        read_options=pacsv.ReadOptions(block_size=1 << 22, use_threads=True),
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True)
+    )
+    return load_arrow_table(conn, table, table_name)
+
+def load_parquet_to_table(conn: sqlite3.Connection, parquet_path: str, table_name: str) -> int:
+    """
+    Load one Parquet file into a typed SQLite table.
+    Returns the number of rows inserted.
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required to load Parquet files")
+    return load_arrow_table(conn, pq.read_table(parquet_path), table_name)
+
+def arrow_column_to_pylist(column: Any) -> List[Any]:
+    """
+    Convert an Arrow column to Python values that SQLite can bind.
+    uint64 values above 2**63 - 1 become floats, as in parse_mavlink_to_sqlite.
+    """
+    values = column.to_pylist()
+    if pa.types.is_uint64(column.type) and (pc.max(column).as_py() or 0) > SQLITE_MAX_INTEGER:
+        values = [float(v) if v is not None and v > SQLITE_MAX_INTEGER else v for v in values]
+    return values
+
+def load_arrow_table(conn: sqlite3.Connection, table: Any, table_name: str) -> int:
+    """
+    Insert a pyarrow Table into a new SQLite table with column types mapped from Arrow.
+    Returns the number of rows inserted.
+    """
+    if table.num_rows == 0:
+        return 0
+    
+    # Map Arrow types to SQLite; anything else is stored as text
+    column_types = []
+    for i, field in enumerate(table.schema):
+        if pa.types.is_integer(field.type) or pa.types.is_boolean(field.type):
+            column_types.append('INTEGER')
+        elif pa.types.is_floating(field.type):
+            column_types.append('REAL')
+        elif pa.types.is_null(field.type):
+            column_types.append('')
+        else:
+            column_types.append('TEXT')
+            if not pa.types.is_string(field.type):
+                table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    
+    column_defs = ', '.join(f'[{col}] {col_type}'.rstrip()
+                            for col, col_type in zip(table.column_names, column_types))
+    insert_sql = f"INSERT INTO [{table_name}] VALUES ({', '.join('?' * table.num_columns)})"
+    
+    # Rows are zipped lazily from the column lists; no per-batch row list is built
+    batches = (
+        zip(*(arrow_column_to_pylist(column) for column in batch.columns))
+        for batch in table.to_batches(max_chunksize=SQLITE_BATCH_SIZE)
+    )
+    return write_table_batches(conn, table_name, column_defs, insert_sql, batches)
+
+def load_csv_to_serialized_db(csv_path: str, table_name: str) -> Tuple[int, bytes]:
+    """
+    Load one CSV file into its own in-memory database (worker side of the parallel load).
+    Returns (row_count, serialized_database).
+    """
+    src = sqlite3.connect(':memory:', check_same_thread=False)
+    try:
+        src.executescript(SQLITE_BULK_LOAD_PRAGMAS)
+        row_count = load_csv_to_table(src, csv_path, table_name)
+        return row_count, src.serialize()
+    finally:
+        src.close()
+
+def copy_serialized_table(conn: sqlite3.Connection, table_name: str, data: bytes) -> None:
+    """
+    Attach a serialized worker database and copy its table into the main database.
+    The table is replaced in one transaction that is rolled back if the copy fails.
+    """
+    conn.execute("ATTACH DATABASE ':memory:' AS src")
+    try:
+        conn.deserialize(data, name='src')
+        
+        # Reuse the worker's CREATE statement to keep declared column types
+        create_sql = conn.execute(
+            "SELECT sql FROM src.sqlite_master WHERE type='table' AND name=?", (table_name,)
+        ).fetchone()[0]
+        
+        conn.execute('BEGIN')
+        try:
+            conn.execute(f"DROP TABLE IF EXISTS main.[{table_name}]")
+            conn.execute(create_sql)
+            conn.execute(f"INSERT INTO main.[{table_name}] SELECT * FROM src.[{table_name}]")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    finally:
+        conn.execute("DETACH DATABASE src")
+        clear_connection_cache(conn)
+
 def load_csvs_to_temp_db(csv_files: Dict[str, str]) -> sqlite3.Connection:
     """
-    Load CSV files into a temporary SQLite database.
+    Load CSV (or Parquet) files into a temporary SQLite database.
+    Tables are parsed in parallel worker threads when sqlite3 supports serialize().
     Returns the database connection.
     """
     try:
         # Create in-memory database
-        conn = sqlite3.connect(':memory:')
+        conn = create_temp_db()
         
-        for msg_type, csv_path in csv_files.items():
-            if os.path.exists(csv_path) and os.path.getsize(csv_path) > 0:
-                try:
-                    # Read CSV with error handling
-                    df = pd.read_csv(csv_path, low_memory=False)
+        # Clean table names for SQLite and skip empty files
+        tasks = [
+            (msg_type, csv_path, clean_table_name(msg_type))
+            for msg_type, csv_path in csv_files.items()
+            if os.path.exists(csv_path) and os.path.getsize(csv_path) > 0
+        ]
+        
+        if len(tasks) > 1 and hasattr(conn, 'serialize'):
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                futures = [
+                    (msg_type, table_name,
+                     executor.submit(load_csv_to_serialized_db, csv_path, table_name))
+                    for msg_type, csv_path, table_name in tasks
+                ]
+                
+                # Copy in submission order so table order matches the input
+                for msg_type, table_name, future in futures:
+                    try:
+                        row_count, data = future.result()
+                        if row_count:
+                            copy_serialized_table(conn, table_name, data)
+                            record_row_counts(conn, {table_name: row_count})
+                            logger.info(f"Loaded {row_count} records into table: {table_name}")
                     
-                    if not df.empty:
-                        # Clean table name for SQLite
-                        table_name = msg_type.replace('-', '_').replace(' ', '_')
-                        
-                        # Write to SQLite
-                        df.to_sql(table_name, conn, if_exists='replace', index=False)
-                        logger.info(f"Loaded {len(df)} records into table: {table_name}")
+                    except Exception as e:
+                        logger.warning(f"Failed to load {msg_type}: {e}")
+                        continue
+        else:
+            for msg_type, csv_path, table_name in tasks:
+                try:
+                    # Write to SQLite
+                    row_count = load_csv_to_table(conn, csv_path, table_name)
+                    if row_count:
+                        logger.info(f"Loaded {row_count} records into table: {table_name}")
                     
                 except Exception as e:
                     logger.warning(f"Failed to load {msg_type}: {e}")
                     continue
         
+        create_time_indexes(conn)
+        
         return conn
         
     except Exception as e:
         logger.error(f"Error loading CSVs to database: {e}")
         raise
 
+@cached_per_connection
 def get_database_schema(conn: sqlite3.Connection) -> Dict[str, Dict[str, Any]]:
     """
     Get complete database schema with table info and column details.
@@ -123,10 +866,15 @@ def get_database_schema(conn: sqlite3.Connection) -> Dict[str, Dict[str, Any]]:
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
         tables = cursor.fetchall()
         
+        # Row counts recorded at load time save a full scan per table
+        known_counts = getattr(conn, 'row_counts', {})
+        
         for (table_name,) in tables:
             # Get table info
-            cursor.execute(f"SELECT COUNT(*) FROM [{table_name}]")
-            row_count = cursor.fetchone()[0]
+            row_count = known_counts.get(table_name)
+            if row_count is None:
+                cursor.execute(f"SELECT COUNT(*) FROM [{table_name}]")
+                row_count = cursor.fetchone()[0]
             
             # Get column info
             cursor.execute(f"PRAGMA table_info([{table_name}])")
@@ -143,137 +891,210 @@ def get_database_schema(conn: sqlite3.Connection) -> Dict[str, Dict[str, Any]]:
     
     return schema
 
+@cached_per_connection
 def detect_numeric_columns(conn: sqlite3.Connection, table_name: str, 
                           sample_size: int = 100) -> List[str]:
     """
     Detect which columns in a table contain numeric data suitable for plotting.
+    Uses declared column types when every column has one, otherwise samples values.
     """
     numeric_columns = []
     
     try:
         cursor = conn.cursor()
+        cursor.execute(f"PRAGMA table_info([{table_name}])")
+        columns = [(col[1], (col[2] or '').upper()) for col in cursor.fetchall()]
         
-        # Get sample data
-        cursor.execute(f"SELECT * FROM [{table_name}] LIMIT {sample_size}")
-        rows = cursor.fetchall()
+        # Untyped columns need the value-based check
+        if not columns or any(col_type not in SQLITE_DECLARED_TYPES for _, col_type in columns):
+            return detect_numeric_columns_from_sample(conn, table_name, sample_size)
         
-        if not rows:
+        typed_columns = [col for col, col_type in columns if col_type in ('INTEGER', 'REAL')]
+        if not typed_columns:
             return numeric_columns
         
-        # Get column names
-        cursor.execute(f"PRAGMA table_info([{table_name}])")
-        columns = [col[1] for col in cursor.fetchall()]
+        # Count values and check for variation in a single aggregate query
+        select_parts = []
+        for col in typed_columns:
+            numeric_val = f"CASE WHEN typeof([{col}]) IN ('integer', 'real') THEN [{col}] END"
+            select_parts.append(
+                f"COUNT([{col}]), COUNT({numeric_val}), MIN({numeric_val}) < MAX({numeric_val})"
+            )
+        column_str = ', '.join(f'[{col}]' for col in typed_columns)
+        cursor.execute(
+            f"SELECT {', '.join(select_parts)} "
+            f"FROM (SELECT {column_str} FROM [{table_name}] LIMIT {sample_size})"
+        )
+        result = cursor.fetchone()
         
-        # Analyze each column
-        for i, col_name in enumerate(columns):
-            values = [row[i] for row in rows if row[i] is not None]
+        for i, col in enumerate(typed_columns):
+            non_null, numeric_count, varies = result[3 * i:3 * i + 3]
             
-            if len(values) < 5:  # Need minimum values
+            # Need minimum values, mostly numeric (80%), and variance
+            if non_null >= 5 and numeric_count >= non_null * 0.8 and varies:
+                numeric_columns.append(col)
+    
+    except Exception as e:
+        logger.warning(f"Error detecting numeric columns for {table_name}: {e}")
+    
+    return numeric_columns
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def column_sample_stats(values):
+        """
+        Single pass over a float64 sample: (valid count, has distinct values, M2).
+        M2 is the Welford sum of squared deviations; it is > 0 when variance is.
+        """
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        prev = np.nan
+        distinct = False
+        for x in values:
+            if np.isnan(x):
                 continue
+            n += 1
+            delta = x - mean
+            mean += delta / n
+            m2 += (x - mean) * delta
+            if n > 1 and x != prev:
+                distinct = True
+            prev = x
+        return n, distinct, m2
+
+def detect_numeric_columns_from_sample(conn: sqlite3.Connection, table_name: str, 
+                                       sample_size: int = 100) -> List[str]:
+    """
+    Detect numeric columns by sampling values, for tables without declared column types.
+    """
+    numeric_columns = []
+    
+    try:
+        # Get sample data
+        df = pd.read_sql_query(f"SELECT * FROM [{table_name}] LIMIT {sample_size}", conn)
+        
+        if df.empty:
+            return numeric_columns
+        
+        # Convert every column at once; non-numeric values become NaN
+        numeric_df = df.apply(pd.to_numeric, errors='coerce')
+        
+        non_null = df.notna().sum()
+        
+        if NUMBA_AVAILABLE:
+            values = numeric_df.to_numpy(dtype=np.float64)
+            for i, col_name in enumerate(numeric_df.columns):
+                numeric_count, distinct, m2 = column_sample_stats(np.ascontiguousarray(values[:, i]))
                 
-            # Try to convert to numeric
-            numeric_values = []
-            for val in values:
-                try:
-                    if isinstance(val, (int, float)):
-                        numeric_values.append(float(val))
-                    elif isinstance(val, str):
-                        # Try to parse as number
-                        parsed = float(val)
-                        numeric_values.append(parsed)
-                except (ValueError, TypeError):
-                    continue
-            
-            # Check if column is mostly numeric and has variance
-            if len(numeric_values) >= len(values) * 0.8:  # 80% numeric
-                if len(set(numeric_values)) > 1:  # Has variance
-                    variance = np.var(numeric_values)
-                    if variance > 0:  # Not all the same value
+                # Need minimum values, mostly numeric (80%), and variance
+                if non_null[col_name] >= 5 and numeric_count >= non_null[col_name] * 0.8:
+                    if distinct and m2 > 0:
                         numeric_columns.append(col_name)
+        else:
+            numeric_count = numeric_df.notna().sum()
+            
+            # Need minimum values, mostly numeric (80%), and variance
+            mask = (
+                (non_null >= 5) &
+                (numeric_count >= non_null * 0.8) &
+                (numeric_df.nunique() > 1) &
+                (numeric_df.var(ddof=0) > 0)
+            )
+            numeric_columns = numeric_df.columns[mask].tolist()
     
     except Exception as e:
         logger.warning(f"Error detecting numeric columns for {table_name}: {e}")
     
     return numeric_columns
 
+# Common patterns and their units/descriptions, in priority order:
+# the first entry found in a column name wins, so specific names come first
+UNIT_PATTERNS = {
+    # Attitude
+    'rollspeed': ('deg/s', 'Roll angular velocity'),
+    'pitchspeed': ('deg/s', 'Pitch angular velocity'),
+    'yawspeed': ('deg/s', 'Yaw angular velocity'),
+    'roll': ('degrees', 'Roll angle'),
+    'pitch': ('degrees', 'Pitch angle'), 
+    'yaw': ('degrees', 'Yaw angle'),
+    
+    # Position
+    'relalt': ('meters', 'Relative altitude'),
+    'alt': ('meters', 'Altitude'),
+    'lat': ('degrees', 'Latitude'),
+    'lng': ('degrees', 'Longitude'),
+    'lon': ('degrees', 'Longitude'),
+    
+    # Velocity
+    'vx': ('m/s', 'Velocity X'),
+    'vy': ('m/s', 'Velocity Y'),
+    'vz': ('m/s', 'Velocity Z'),
+    'vel': ('m/s', 'Velocity'),
+    'groundspeed': ('m/s', 'Ground speed'),
+    'airspeed': ('m/s', 'Air speed'),
+    'speed': ('m/s', 'Speed'),
+    
+    # Acceleration
+    'accx': ('m/s²', 'Acceleration X'),
+    'accy': ('m/s²', 'Acceleration Y'),
+    'accz': ('m/s²', 'Acceleration Z'),
+    'acc': ('m/s²', 'Acceleration'),
+    
+    # Angular rates
+    'gyrx': ('deg/s', 'Angular rate X'),
+    'gyry': ('deg/s', 'Angular rate Y'),
+    'gyrz': ('deg/s', 'Angular rate Z'),
+    
+    # Power
+    'volt': ('V', 'Voltage'),
+    'curr': ('A', 'Current'),
+    'bat': ('V', 'Battery voltage'),
+    'power': ('W', 'Power'),
+    
+    # Pressure/Altitude
+    'press': ('Pa', 'Pressure'),
+    'baro': ('m', 'Barometric altitude'),
+    'temp': ('°C', 'Temperature'),
+    
+    # Control
+    'throttle': ('%', 'Throttle'),
+    'thr': ('%', 'Throttle'),
+    'rud': ('%', 'Rudder'),
+    'ele': ('%', 'Elevator'),
+    'ail': ('%', 'Aileron'),
+    
+    # Time
+    'timeus': ('μs', 'Time (microseconds)'),
+    'timestamp': ('s', 'Timestamp'),
+    'time': ('s', 'Time'),
+    
+    # Single-letter body rates, only when nothing else matches
+    'p': ('deg/s', 'Roll rate'),
+    'q': ('deg/s', 'Pitch rate'),
+    'r': ('deg/s', 'Yaw rate'),
+}
+
+UNIT_PATTERN_PRIORITY = {pattern: i for i, pattern in enumerate(UNIT_PATTERNS)}
+
+# A lookahead alternation in priority order yields the best pattern starting at each position
+UNIT_PATTERN_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(p) for p in UNIT_PATTERNS) + '))'
+)
+
 def infer_units_and_descriptions(column_name: str) -> Tuple[str, str]:
     """
     Infer units and descriptions for common MAVLink parameters.
     """
-    col_lower = column_name.lower()
-    
-    # Common patterns and their units/descriptions
-    patterns = {
-        # Attitude
-        'roll': ('degrees', 'Roll angle'),
-        'pitch': ('degrees', 'Pitch angle'), 
-        'yaw': ('degrees', 'Yaw angle'),
-        'rollspeed': ('deg/s', 'Roll angular velocity'),
-        'pitchspeed': ('deg/s', 'Pitch angular velocity'),
-        'yawspeed': ('deg/s', 'Yaw angular velocity'),
-        
-        # Position
-        'lat': ('degrees', 'Latitude'),
-        'lng': ('degrees', 'Longitude'),
-        'lon': ('degrees', 'Longitude'),
-        'alt': ('meters', 'Altitude'),
-        'relalt': ('meters', 'Relative altitude'),
-        
-        # Velocity
-        'vx': ('m/s', 'Velocity X'),
-        'vy': ('m/s', 'Velocity Y'),
-        'vz': ('m/s', 'Velocity Z'),
-        'vel': ('m/s', 'Velocity'),
-        'speed': ('m/s', 'Speed'),
-        'groundspeed': ('m/s', 'Ground speed'),
-        'airspeed': ('m/s', 'Air speed'),
-        
-        # Acceleration
-        'accx': ('m/s²', 'Acceleration X'),
-        'accy': ('m/s²', 'Acceleration Y'),
-        'accz': ('m/s²', 'Acceleration Z'),
-        'acc': ('m/s²', 'Acceleration'),
-        
-        # Angular rates
-        'gyrx': ('deg/s', 'Angular rate X'),
-        'gyry': ('deg/s', 'Angular rate Y'),
-        'gyrz': ('deg/s', 'Angular rate Z'),
-        'p': ('deg/s', 'Roll rate'),
-        'q': ('deg/s', 'Pitch rate'),
-        'r': ('deg/s', 'Yaw rate'),
-        
-        # Power
-        'volt': ('V', 'Voltage'),
-        'curr': ('A', 'Current'),
-        'bat': ('V', 'Battery voltage'),
-        'power': ('W', 'Power'),
-        
-        # Pressure/Altitude
-        'press': ('Pa', 'Pressure'),
-        'baro': ('m', 'Barometric altitude'),
-        'temp': ('°C', 'Temperature'),
-        
-        # Control
-        'thr': ('%', 'Throttle'),
-        'throttle': ('%', 'Throttle'),
-        'rud': ('%', 'Rudder'),
-        'ele': ('%', 'Elevator'),
-        'ail': ('%', 'Aileron'),
-        
-        # Time
-        'timeus': ('μs', 'Time (microseconds)'),
-        'timestamp': ('s', 'Timestamp'),
-        'time': ('s', 'Time'),
-    }
-    
-    # Check for pattern matches
-    for pattern, (unit, desc) in patterns.items():
-        if pattern in col_lower:
-            return unit, desc
+    # One scan finds every candidate; the earliest table entry wins
+    matches = UNIT_PATTERN_RE.findall(column_name.lower())
+    if matches:
+        return UNIT_PATTERNS[min(matches, key=UNIT_PATTERN_PRIORITY.__getitem__)]
     
     # Default fallback
     return '', column_name.replace('_', ' ').title()
 
+@cached_per_connection
 def get_time_column(conn: sqlite3.Connection, table_name: str) -> Optional[str]:
     """
     Find the time column in a table (TimeUS, timestamp, etc.).
@@ -297,6 +1118,29 @@ def get_time_column(conn: sqlite3.Connection, table_name: str) -> Optional[str]:
         logger.warning(f"Error finding time column for {table_name}: {e}")
         return None
 
+def create_time_indexes(conn: sqlite3.Connection, table_names: Optional[List[str]] = None) -> None:
+    """
+    Index each table's time column, so time-window counts, range scans and
+    MIN/MAX bounds are index seeks instead of full scans. Defaults to all tables.
+    """
+    if table_names is None:
+        table_names = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='table'"
+        )]
+    
+    for table_name in table_names:
+        time_col = get_time_column(conn, table_name)
+        if not time_col:
+            continue
+        try:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS [idx_{table_name}_time] ON [{table_name}]([{time_col}])"
+            )
+        except Exception as e:
+            logger.warning(f"Could not index time column of {table_name}: {e}")
+    
+    conn.commit()
+
 def get_all_dynamic_attributes(conn: sqlite3.Connection) -> Dict[str, Dict[str, Any]]:
     """
     Get all dynamic attributes from all tables in the database.
@@ -344,6 +1188,45 @@ def get_all_dynamic_attributes(conn: sqlite3.Connection) -> Dict[str, Dict[str,
     
     return dynamic_attrs
 
+@cached_per_connection
+def get_time_bounds(conn: sqlite3.Connection, table_name: str) -> Optional[Tuple[float, float]]:
+    """
+    Get the first and last value of a table's time column, in raw units.
+    """
+    time_col = get_time_column(conn, table_name)
+    if not time_col:
+        return None
+    
+    try:
+        # Separate subqueries so each bound is a single index seek
+        start, end = conn.execute(
+            f"SELECT (SELECT MIN([{time_col}]) FROM [{table_name}]), "
+            f"(SELECT MAX([{time_col}]) FROM [{table_name}])"
+        ).fetchone()
+    except Exception as e:
+        logger.warning(f"Could not read time range of {table_name}: {e}")
+        return None
+    
+    if start is None or end is None:
+        return None
+    return float(start), float(end)
+
+def format_timeus_as_mmss(timeus_values: pd.Series) -> pd.Series:
+    """
+    Format TimeUS (microseconds) values as MM:SS strings.
+    """
+    # Convert microseconds to whole seconds with whole-array integer arithmetic
+    seconds = timeus_values.to_numpy(dtype=np.float64) / 1_000_000
+    total_seconds = np.floor(seconds).astype(np.int64)
+    minutes = total_seconds // 60
+    seconds_remainder = total_seconds % 60
+    formatted = np.char.add(
+        np.char.add(minutes.astype(str), ':'),
+        np.char.zfill(seconds_remainder.astype(str), 2)
+    )
+    
+    return pd.Series(formatted, index=timeus_values.index, dtype=object)
+
 def convert_timeus_to_datetime_and_format(timeus_values: pd.Series) -> Tuple[pd.Series, pd.Series]:
     """
     Convert TimeUS (microseconds) to datetime objects and MM:SS formatted strings.
@@ -356,19 +1239,52 @@ def convert_timeus_to_datetime_and_format(timeus_values: pd.Series) -> Tuple[pd.
     datetime_series = pd.to_datetime(seconds, unit='s')
     
     # Create MM:SS formatted strings
-    def format_time(sec):
-        minutes = int(sec // 60)
-        seconds_remainder = int(sec % 60)
-        return f"{minutes}:{seconds_remainder:02d}"
-    
-    formatted_series = seconds.apply(format_time)
+    formatted_series = format_timeus_as_mmss(timeus_values)
     
     return datetime_series, formatted_series
 
+def to_column_array(values: Tuple[Any, ...]) -> np.ndarray:
+    """
+    Turn one column of query results into a NumPy array, with NULLs as NaN when numeric.
+    """
+    arr = np.asarray(values)
+    if arr.dtype == object:
+        try:
+            arr = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            pass
+    return arr
+
+def downcast_column_array(arr: np.ndarray) -> np.ndarray:
+    """
+    Narrow a numeric column to float32 or a smaller integer type when no value changes.
+    Most telemetry fields are float32 on the wire, so the round trip is usually exact.
+    """
+    if arr.dtype == np.float64:
+        narrowed = arr.astype(np.float32)
+        if np.array_equal(narrowed, arr, equal_nan=True):
+            return narrowed
+    elif arr.dtype.kind in 'iu' and arr.size:
+        low, high = arr.min(), arr.max()
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return arr.astype(dtype)
+    return arr
+
 def get_chart_data(conn: sqlite3.Connection, message_type: str, 
-                   attributes: List[str], limit: Optional[int] = None) -> Dict[str, Any]:
+                   attributes: List[str], limit: Optional[int] = None,
+                   max_points: Optional[int] = 10_000,
+                   with_stats: bool = False, legacy: bool = False,
+                   time_range: Optional[Tuple[float, float]] = None) -> Dict[str, Any]:
     """
     Get data for chart visualization with proper time formatting.
+    Rows are downsampled in SQL to at most max_points with an even stride, so the
+    sample keeps the data's distribution (None reads every row in one scan).
+    time_range (raw time column units) restricts the query to a zoomed window,
+    which is then downsampled on its own so zooming in reveals more detail.
+    With with_stats=True, full-table statistics are included under 'stats'.
+    TimeUS is plotted as numeric seconds; legacy=True restores the datetime column.
     """
     try:
         # Get time column
@@ -376,22 +1292,59 @@ def get_chart_data(conn: sqlite3.Connection, message_type: str,
         if not time_col:
             raise ValueError(f"No time column found for {message_type}")
         
-        # Build query
+        # Build query over the time column and each requested attribute, once
+        attributes = [attr for attr in dict.fromkeys(attributes) if attr != time_col]
         columns = [time_col] + attributes
         column_str = ', '.join([f'[{col}]' for col in columns])
         
         query = f"SELECT {column_str} FROM [{message_type}]"
+        conditions = []
+        params: List[Any] = []
+        
+        if time_range is not None:
+            conditions.append(f"[{time_col}] BETWEEN ? AND ?")
+            params.extend(time_range)
+            row_count = conn.execute(
+                f"SELECT COUNT(*) FROM [{message_type}] WHERE {conditions[0]}", params
+            ).fetchone()[0]
+        else:
+            row_count = get_database_schema(conn).get(message_type, {}).get('row_count')
+        
+        # Keep every stride-th row, starting with the first
+        if max_points and row_count:
+            n_rows = min(row_count, limit) if limit else row_count
+            stride = -(-n_rows // max_points)
+            if stride > 1:
+                conditions.append(f"(rowid - 1) % {stride} = 0")
+                if limit:
+                    limit = -(-limit // stride)
+        
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        
         if limit:
             query += f" LIMIT {limit}"
         
-        # Execute query
-        df = pd.read_sql_query(query, conn)
+        # Execute query and build the frame column by column (one contiguous array each)
+        cursor = conn.execute(query, params)
+        rows = cursor.fetchall()
         
-        if df.empty:
+        if not rows:
             return {'error': 'No data found'}
         
+        names = [desc[0] for desc in cursor.description]
+        arrays = [to_column_array(values) for values in zip(*rows)]
+        # Attributes are stored narrow when lossless; the time column keeps full width
+        arrays[1:] = [downcast_column_array(arr) for arr in arrays[1:]]
+        df = pd.DataFrame(dict(zip(names, arrays)), copy=False)
+        
         # Convert time column
-        if 'timeus' in time_col.lower():
+        if 'timeus' in time_col.lower() and not legacy:
+            # Plotly takes numeric seconds directly; no datetime parsing needed
+            df['time_seconds'] = df[time_col].to_numpy(dtype=np.float64) * 1e-6
+            df['time_formatted'] = format_timeus_as_mmss(df[time_col])
+            time_column = 'time_seconds'
+        elif 'timeus' in time_col.lower():
             datetime_col, formatted_col = convert_timeus_to_datetime_and_format(df[time_col])
             df['datetime'] = datetime_col
             df['time_formatted'] = formatted_col
@@ -402,7 +1355,7 @@ def get_chart_data(conn: sqlite3.Connection, message_type: str,
             df['time_formatted'] = df[time_col].astype(str)
             time_column = 'datetime'
         
-        return {
+        chart_data = {
             'data': df,
             'time_column': time_column,
             'time_formatted_column': 'time_formatted',
@@ -410,6 +1363,15 @@ def get_chart_data(conn: sqlite3.Connection, message_type: str,
             'message_type': message_type
         }
         
+        if with_stats:
+            if time_range is None and len(rows) == row_count:
+                # Every row is already in memory; skip the extra SQL scans
+                chart_data['stats'] = calculate_frame_statistics(df, attributes)
+            else:
+                chart_data['stats'] = calculate_data_statistics(conn, message_type, attributes)
+        
+        return chart_data
+        
     except Exception as e:
         logger.error(f"Error getting chart data: {e}")
         return {'error': str(e)}
@@ -418,29 +1380,117 @@ def calculate_data_statistics(conn: sqlite3.Connection, message_type: str,
                             attributes: List[str]) -> Dict[str, Any]:
     """
     Calculate basic statistics for the selected attributes.
+    Everything is aggregated inside SQLite, so no rows are copied into pandas.
     """
     try:
-        column_str = ', '.join([f'[{attr}]' for attr in attributes])
-        query = f"SELECT {column_str} FROM [{message_type}]"
+        if not attributes:
+            return {}
         
-        df = pd.read_sql_query(query, conn)
+        # Means first, then squared deviations from them (more stable than sum of squares)
+        mean_parts = ', '.join(f'AVG([{attr}]) AS m{i}' for i, attr in enumerate(attributes))
+        stat_parts = ', '.join(
+            f'm{i}, SUM(([{attr}] - m{i}) * ([{attr}] - m{i})), '
+            f'MIN([{attr}]), MAX([{attr}]), COUNT([{attr}])'
+            for i, attr in enumerate(attributes)
+        )
+        query = (
+            f"WITH means AS (SELECT {mean_parts} FROM [{message_type}]) "
+            f"SELECT COUNT(*), {stat_parts} FROM [{message_type}], means"
+        )
         
-        if df.empty:
+        result = conn.execute(query).fetchone()
+        
+        if not result or result[0] == 0:
             return {'error': 'No data found'}
         
         stats = {}
-        for attr in attributes:
-            if attr in df.columns:
-                stats[attr] = {
-                    'mean': float(df[attr].mean()),
-                    'std': float(df[attr].std()),
-                    'min': float(df[attr].min()),
-                    'max': float(df[attr].max()),
-                    'count': int(df[attr].count())
-                }
+        for i, attr in enumerate(attributes):
+            mean, sq_dev, min_val, max_val, count = result[1 + 5 * i:6 + 5 * i]
+            stats[attr] = {
+                'mean': float(mean) if mean is not None else float('nan'),
+                'std': float(np.sqrt(sq_dev / (count - 1))) if count > 1 else float('nan'),
+                'min': float(min_val) if min_val is not None else float('nan'),
+                'max': float(max_val) if max_val is not None else float('nan'),
+                'count': int(count)
+            }
         
         return stats
         
     except Exception as e:
         logger.error(f"Error calculating statistics: {e}")
-        return {'error': str(e)}
\ No newline at end of file
+        return {'error': str(e)}
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=NUMBA_PARALLEL, cache=True)
+    def column_stats(values):
+        """
+        One Welford pass per row of a (columns, rows) float64 array, columns in parallel.
+        Returns (count, mean, M2, min, max) per column; NaNs are skipped.
+        """
+        n_cols, n_rows = values.shape
+        out = np.full((n_cols, 5), np.nan)
+        for j in prange(n_cols):
+            n = 0
+            mean = 0.0
+            m2 = 0.0
+            low = np.inf
+            high = -np.inf
+            for i in range(n_rows):
+                x = values[j, i]
+                if np.isnan(x):
+                    continue
+                n += 1
+                delta = x - mean
+                mean += delta / n
+                m2 += (x - mean) * delta
+                if x < low:
+                    low = x
+                if x > high:
+                    high = x
+            out[j, 0] = n
+            if n > 0:
+                out[j, 1] = mean
+                out[j, 2] = m2
+                out[j, 3] = low
+                out[j, 4] = high
+        return out
+
+def calculate_frame_statistics(df: pd.DataFrame, attributes: List[str]) -> Dict[str, Any]:
+    """
+    Calculate the same statistics as calculate_data_statistics from rows already in memory.
+    Uses the numba kernel when available, otherwise NumPy reductions.
+    """
+    try:
+        if not attributes:
+            return {}
+        
+        values = np.stack([df[attr].to_numpy(dtype=np.float64) for attr in attributes])
+        
+        if NUMBA_AVAILABLE:
+            moments = column_stats(values)
+            counts, means, m2, mins, maxs = moments.T
+        else:
+            valid = ~np.isnan(values)
+            counts = valid.sum(axis=1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                means = np.nansum(values, axis=1) / counts
+                m2 = np.nansum((values - means[:, None]) ** 2, axis=1)
+            mins = np.where(counts > 0, np.fmin.reduce(values, axis=1), np.nan)
+            maxs = np.where(counts > 0, np.fmax.reduce(values, axis=1), np.nan)
+        
+        stats = {}
+        for i, attr in enumerate(attributes):
+            count = int(counts[i])
+            stats[attr] = {
+                'mean': float(means[i]) if count else float('nan'),
+                'std': float(np.sqrt(m2[i] / (count - 1))) if count > 1 else float('nan'),
+                'min': float(mins[i]),
+                'max': float(maxs[i]),
+                'count': count
+            }
+        
+        return stats
+        
+    except Exception as e:
+        logger.error(f"Error calculating statistics: {e}")
+        return {'error': str(e)}
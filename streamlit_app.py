@@ -1,20 +1,32 @@
 import streamlit as st
 import tempfile
+import shutil
 import os
 import zipfile
 import io
+import csv
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from PIL import Image, ImageDraw
+
+# Optional shape-preserving downsampling (Rust/SIMD)
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+    TSDOWNSAMPLE_AVAILABLE = True
+except ImportError:
+    TSDOWNSAMPLE_AVAILABLE = False
+
 from core import (
-    parse_all_mavlink_messages_to_csv,
-    load_csvs_to_temp_db,
+    create_temp_db,
+    parse_mavlink_to_sqlite,
     get_all_dynamic_attributes,
     get_chart_data,
-    calculate_data_statistics,
-    get_database_schema
+    get_time_bounds,
+    get_database_schema,
+    open_readonly_db
 )
 
 # Page configuration
@@ -25,7 +37,46 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def create_time_series_chart(chart_data, selected_attributes, message_type):
+# Client-side payload limits for the correlation, distribution and trajectory views
+SCATTER_MATRIX_MAX_POINTS = 5000
+DENSITY_IMAGE_MAX_POINTS = 200_000
+HISTOGRAM_BINS = 30
+TRAJECTORY_MAX_POINTS = 5000
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def load_chart_data(_conn, db_id, message_type, attributes, time_range):
+    """
+    Fetch every row of the window once per database and query; widget-only reruns reuse it.
+    Each view thins the rows itself: MinMaxLTTB for time series, an even stride elsewhere.
+    """
+    return get_chart_data(_conn, message_type, list(attributes), max_points=None,
+                          with_stats=True, time_range=time_range)
+
+def stride_sample(df, max_rows):
+    """Keep every stride-th row so the sample follows the data's distribution."""
+    if len(df) <= max_rows:
+        return df
+    return df.iloc[::-(-len(df) // max_rows)]
+
+def downsample_indices(x, y, n_out):
+    """Pick row indices that keep the visual shape of y over x (MinMaxLTTB)."""
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+    
+    if TSDOWNSAMPLE_AVAILABLE:
+        try:
+            if np.issubdtype(x.dtype, np.datetime64):
+                x = x.view(np.int64)
+            idx = MinMaxLTTBDownsampler().downsample(x, y.astype(np.float64, copy=False), n_out=n_out)
+            return idx.astype(np.intp)
+        except Exception:
+            pass
+    
+    # Fallback: evenly spaced rows
+    return np.linspace(0, n - 1, n_out).astype(np.intp)
+
+def create_time_series_chart(chart_data, selected_attributes, message_type, points_per_trace=2000):
     """Create time series chart with MM:SS formatted time axis."""
     if 'error' in chart_data:
         st.error(f"Error loading data: {chart_data['error']}")
@@ -35,48 +86,61 @@ def create_time_series_chart(chart_data, selected_attributes, message_type):
     time_col = chart_data['time_column']
     time_formatted_col = chart_data['time_formatted_column']
     
-    # Create subplots
-    n_attrs = len(selected_attributes)
-    fig = make_subplots(
-        rows=n_attrs,
-        cols=1,
-        subplot_titles=selected_attributes,
-        shared_xaxes=True,
-        vertical_spacing=0.05
-    )
+    # Plain arrays, taken once and shared by every trace and the axis ticks
+    t_arr = df[time_col].to_numpy()
+    tf_arr = df[time_formatted_col].to_numpy()
     
-    # Add traces for each attribute
-    for i, attr in enumerate(selected_attributes, 1):
-        if attr in df.columns:
-            fig.add_trace(
-                go.Scatter(
-                    x=df[time_col],
-                    y=df[attr],
-                    mode='lines',
-                    name=attr,
-                    hovertemplate=f'<b>{attr}</b><br>' +
-                                f'Time: %{{customdata}}<br>' +
-                                f'Value: %{{y:.3f}}<extra></extra>',
-                    customdata=df[time_formatted_col],
-                    line=dict(width=1.5)
-                ),
-                row=i, col=1
-            )
+    # Downsample each attribute to the point budget and stack them in long format
+    plotted_attrs = [attr for attr in selected_attributes if attr in df.columns]
+    if not plotted_attrs:
+        return None
+    
+    parts = []
+    for attr in plotted_attrs:
+        y_arr = df[attr].to_numpy()
+        idx = downsample_indices(t_arr, y_arr, points_per_trace)
+        parts.append(pd.DataFrame({
+            time_col: t_arr[idx],
+            time_formatted_col: tf_arr[idx],
+            'attribute': attr,
+            'value': y_arr[idx]
+        }))
+    long_df = pd.concat(parts, ignore_index=True)
+    
+    # One faceted figure: rows share the x axis, layout and trace template
+    n_attrs = len(plotted_attrs)
+    fig = px.line(
+        long_df,
+        x=time_col,
+        y='value',
+        color='attribute',
+        facet_row='attribute',
+        category_orders={'attribute': plotted_attrs},
+        custom_data=[time_formatted_col],
+        labels={time_col: "Flight Time (MM:SS)", 'value': ''},
+        facet_row_spacing=0.05,
+        render_mode='webgl'
+    )
+    fig.update_yaxes(matches=None)
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split('=', 1)[-1]))
+    fig.update_traces(
+        hovertemplate='<b>%{fullData.name}</b><br>' +
+                      'Time: %{customdata[0]}<br>' +
+                      'Value: %{y:.3f}<extra></extra>',
+        line=dict(width=1.5)
+    )
     
     # Update layout with custom time axis
-    if not df.empty:
+    if len(t_arr):
         # Create custom tick values (every 30 seconds or so)
-        time_range = df[time_col].max() - df[time_col].min()
-        n_ticks = min(15, len(df) // 50)  # Reasonable number of ticks
+        n_ticks = min(15, len(t_arr) // 50)  # Reasonable number of ticks
         
         if n_ticks > 0:
-            tick_indices = np.linspace(0, len(df)-1, n_ticks, dtype=int)
-            tick_vals = df[time_col].iloc[tick_indices]
-            tick_texts = df[time_formatted_col].iloc[tick_indices]
+            tick_indices = np.linspace(0, len(t_arr) - 1, n_ticks).astype(np.intp)
             
             fig.update_xaxes(
-                tickvals=tick_vals,
-                ticktext=tick_texts,
+                tickvals=t_arr[tick_indices],
+                ticktext=tf_arr[tick_indices],
                 tickangle=45
             )
     
@@ -87,10 +151,13 @@ def create_time_series_chart(chart_data, selected_attributes, message_type):
         hovermode='x unified'
     )
     
-    fig.update_xaxes(title_text="Flight Time (MM:SS)", row=n_attrs, col=1)
-    
     return fig
 
+def get_numeric_attributes(df, selected_attributes):
+    """Selected attributes present in df with a numeric dtype of any width."""
+    return [attr for attr in selected_attributes
+            if attr in df.columns and pd.api.types.is_numeric_dtype(df[attr])]
+
 def create_scatter_matrix(chart_data, selected_attributes):
     """Create scatter matrix for correlation analysis."""
     if 'error' in chart_data or len(selected_attributes) < 2:
@@ -99,11 +166,14 @@ def create_scatter_matrix(chart_data, selected_attributes):
     df = chart_data['data']
     
     # Select numeric columns only
-    numeric_df = df[selected_attributes].select_dtypes(include=[np.number])
+    numeric_attrs = get_numeric_attributes(df, selected_attributes)
     
-    if numeric_df.empty or len(numeric_df.columns) < 2:
+    if df.empty or len(numeric_attrs) < 2:
         return None
     
+    # Every pair is drawn, so cap the rows with an even stride
+    numeric_df = stride_sample(df[numeric_attrs], SCATTER_MATRIX_MAX_POINTS)
+    
     fig = px.scatter_matrix(
         numeric_df,
         title="Parameter Correlation Matrix",
@@ -115,62 +185,138 @@ def create_scatter_matrix(chart_data, selected_attributes):
     
     return fig
 
-def create_3d_trajectory(chart_data):
+@st.cache_data(max_entries=16, show_spinner=False)
+def render_scatter_matrix_png(numeric_df, panel_size=200):
+    """Rasterize each attribute pair into a point-density panel and tile them into one PNG."""
+    attrs = list(numeric_df.columns)
+    values = [numeric_df[attr].to_numpy(dtype=np.float64) for attr in attrs]
+    n_panels = len(attrs) - 1
+    gap, left, bottom = 6, 110, 24
+    
+    width = left + n_panels * (panel_size + gap)
+    height = n_panels * (panel_size + gap) + bottom
+    image = Image.new('RGB', (width, height), 'white')
+    draw = ImageDraw.Draw(image)
+    shade_color = np.array([31, 119, 180], dtype=np.float64)
+    
+    # Lower half only, like the interactive matrix: row attribute on y, column on x
+    for row in range(n_panels):
+        y_values = values[row + 1]
+        for col in range(row + 1):
+            x_values = values[col]
+            valid = np.isfinite(x_values) & np.isfinite(y_values)
+            x0 = left + col * (panel_size + gap)
+            y0 = row * (panel_size + gap)
+            
+            if valid.any():
+                counts, _, _ = np.histogram2d(x_values[valid], y_values[valid], bins=panel_size)
+                shade = np.log1p(counts.T[::-1])
+                shade /= shade.max()
+                pixels = 255 - shade[..., None] * (255 - shade_color)
+                image.paste(Image.fromarray(pixels.astype(np.uint8), 'RGB'), (x0, y0))
+            
+            draw.rectangle([x0, y0, x0 + panel_size - 1, y0 + panel_size - 1], outline='lightgray')
+        
+        draw.text((4, row * (panel_size + gap) + panel_size // 2), attrs[row + 1], fill='black')
+    
+    for col in range(n_panels):
+        draw.text((left + col * (panel_size + gap), n_panels * (panel_size + gap) + 4),
+                  attrs[col], fill='black')
+    
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+def create_scatter_matrix_image(chart_data, selected_attributes):
+    """Create a static density image of the scatter matrix from an even sample of the rows."""
+    if 'error' in chart_data or len(selected_attributes) < 2:
+        return None
+    
+    df = chart_data['data']
+    numeric_attrs = get_numeric_attributes(df, selected_attributes)
+    
+    if df.empty or len(numeric_attrs) < 2:
+        return None
+    
+    return render_scatter_matrix_png(stride_sample(df[numeric_attrs], DENSITY_IMAGE_MAX_POINTS))
+
+def find_gps_candidates(columns):
+    """Split columns into latitude, longitude and altitude candidates in a single pass."""
+    lat_cols, lon_cols, alt_cols = [], [], []
+    for col in columns:
+        name = col.lower()
+        if 'lat' in name:
+            lat_cols.append(col)
+        if 'lng' in name or 'lon' in name:
+            lon_cols.append(col)
+        if 'alt' in name:
+            alt_cols.append(col)
+    return lat_cols, lon_cols, alt_cols
+
+def create_3d_trajectory(chart_data, all_attributes):
     """Create 3D trajectory plot if GPS data is available."""
     if 'error' in chart_data:
         return None
     
     df = chart_data['data']
     
-    # Look for GPS coordinates
-    lat_cols = [col for col in df.columns if 'lat' in col.lower()]
-    lon_cols = [col for col in df.columns if any(x in col.lower() for x in ['lng', 'lon'])]
-    alt_cols = [col for col in df.columns if 'alt' in col.lower()]
+    # GPS candidates are scanned once per message type, then matched against the fetched columns
+    gps_cache = st.session_state.setdefault('gps_cols', {})
+    cache_key = (chart_data.get('message_type'), tuple(all_attributes))
+    if cache_key not in gps_cache:
+        gps_cache[cache_key] = find_gps_candidates(all_attributes)
+    lat_col, lon_col, alt_col = (
+        next((col for col in candidates if col in df.columns), None)
+        for candidates in gps_cache[cache_key]
+    )
     
-    if not (lat_cols and lon_cols):
+    if not (lat_col and lon_col):
         return None
     
-    lat_col = lat_cols[0]
-    lon_col = lon_cols[0]
-    alt_col = alt_cols[0] if alt_cols else None
-    
-    # Check if we have valid GPS data
-    if df[lat_col].isna().all() or df[lon_col].isna().all():
+    # Check if we have valid GPS data (stops at the first non-null value)
+    if df[lat_col].first_valid_index() is None or df[lon_col].first_valid_index() is None:
         return None
     
-    if alt_col and not df[alt_col].isna().all():
-        fig = px.line_3d(
-            df,
-            x=lon_col,
-            y=lat_col,
-            z=alt_col,
-            title="3D Flight Trajectory",
-            labels={
-                lon_col: "Longitude",
-                lat_col: "Latitude", 
-                alt_col: "Altitude (m)"
-            }
+    if alt_col and df[alt_col].first_valid_index() is not None:
+        # Evenly thinned float32 arrays; both ends are always kept
+        idx = np.linspace(0, len(df) - 1, min(len(df), TRAJECTORY_MAX_POINTS)).astype(np.intp)
+        lon = df[lon_col].to_numpy(dtype=np.float32)[idx]
+        lat = df[lat_col].to_numpy(dtype=np.float32)[idx]
+        alt = df[alt_col].to_numpy(dtype=np.float32)[idx]
+        
+        fig = go.Figure(
+            go.Scatter3d(x=lon, y=lat, z=alt, mode='lines', name='Trajectory', showlegend=False)
         )
         
         # Add start and end markers
-        fig.add_scatter3d(
-            x=[df[lon_col].iloc[0]],
-            y=[df[lat_col].iloc[0]],
-            z=[df[alt_col].iloc[0]] if alt_col else [0],
-            mode='markers',
-            marker=dict(size=10, color='green'),
-            name='Start',
-            showlegend=True
-        )
+        fig.add_traces([
+            go.Scatter3d(
+                x=[float(lon[0])],
+                y=[float(lat[0])],
+                z=[float(alt[0])],
+                mode='markers',
+                marker=dict(size=10, color='green'),
+                name='Start',
+                showlegend=True
+            ),
+            go.Scatter3d(
+                x=[float(lon[-1])],
+                y=[float(lat[-1])],
+                z=[float(alt[-1])],
+                mode='markers',
+                marker=dict(size=10, color='red'),
+                name='End',
+                showlegend=True
+            )
+        ])
         
-        fig.add_scatter3d(
-            x=[df[lon_col].iloc[-1]],
-            y=[df[lat_col].iloc[-1]],
-            z=[df[alt_col].iloc[-1]] if alt_col else [0],
-            mode='markers',
-            marker=dict(size=10, color='red'),
-            name='End',
-            showlegend=True
+        fig.update_layout(
+            title="3D Flight Trajectory",
+            scene=dict(
+                xaxis_title="Longitude",
+                yaxis_title="Latitude",
+                zaxis_title="Altitude (m)"
+            )
         )
     else:
         # 2D trajectory
@@ -179,7 +325,8 @@ def create_3d_trajectory(chart_data):
             x=lon_col,
             y=lat_col,
             title="Flight Path (2D)",
-            labels={lon_col: "Longitude", lat_col: "Latitude"}
+            labels={lon_col: "Longitude", lat_col: "Latitude"},
+            render_mode='webgl'
         )
         
         # Add markers
@@ -210,7 +357,7 @@ def create_distribution_plots(chart_data, selected_attributes):
     df = chart_data['data']
     
     # Filter numeric columns
-    numeric_attrs = [attr for attr in selected_attributes if attr in df.columns and df[attr].dtype in ['int64', 'float64']]
+    numeric_attrs = get_numeric_attributes(df, selected_attributes)
     
     if not numeric_attrs:
         return None
@@ -222,19 +369,31 @@ def create_distribution_plots(chart_data, selected_attributes):
         subplot_titles=numeric_attrs
     )
     
+    # Collect every subplot's trace, then add them in one call
+    traces, rows, cols = [], [], []
     for i, attr in enumerate(numeric_attrs):
-        row = (i // 2) + 1
-        col = (i % 2) + 1
+        # Bin on the server so only the bin counts are sent to the browser
+        values = df[attr].to_numpy(dtype=np.float64)
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            continue
+        counts, edges = np.histogram(values, bins=HISTOGRAM_BINS)
         
-        fig.add_trace(
-            go.Histogram(
-                x=df[attr],
+        traces.append(
+            go.Bar(
+                x=edges[:-1],
+                y=counts,
+                width=np.diff(edges),
+                offset=0,
                 name=attr,
-                showlegend=False,
-                nbinsx=30
-            ),
-            row=row, col=col
+                showlegend=False
+            )
         )
+        rows.append((i // 2) + 1)
+        cols.append((i % 2) + 1)
+    
+    if traces:
+        fig.add_traces(traces, rows=rows, cols=cols)
     
     fig.update_layout(
         title="Parameter Distributions",
@@ -254,14 +413,15 @@ def export_selected_data(conn, selected_tables):
     with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
         for table_name in selected_tables:
             try:
-                # Query table data
-                df = pd.read_sql_query(f"SELECT * FROM [{table_name}]", conn)
+                # Query table data; the cursor yields rows lazily
+                cursor = conn.execute(f"SELECT * FROM [{table_name}]")
                 
-                # Convert to CSV string
-                csv_string = df.to_csv(index=False)
-                
-                # Add to ZIP
-                zip_file.writestr(f"{table_name}.csv", csv_string)
+                # Stream the rows straight into the ZIP member as CSV
+                with zip_file.open(f"{table_name}.csv", 'w') as member, \
+                        io.TextIOWrapper(member, encoding='utf-8', newline='') as text_stream:
+                    writer = csv.writer(text_stream, lineterminator='\n')
+                    writer.writerow([desc[0] for desc in cursor.description])
+                    writer.writerows(cursor)
                 
             except Exception as e:
                 st.error(f"Error exporting {table_name}: {e}")
@@ -294,36 +454,43 @@ def main():
             if st.button("🔄 Process Log File", type="primary"):
                 with st.spinner("Processing MAVLink log..."):
                     try:
-                        # Save uploaded file temporarily
+                        # Save uploaded file temporarily, streamed in 1 MB chunks
                         with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-                            tmp_file.write(uploaded_file.read())
+                            uploaded_file.seek(0)
+                            shutil.copyfileobj(uploaded_file, tmp_file, length=1024 * 1024)
                             tmp_file_path = tmp_file.name
                         
-                        # Create temporary directory for CSVs
-                        with tempfile.TemporaryDirectory() as temp_dir:
-                            # Parse MAVLink messages
-                            csv_files = parse_all_mavlink_messages_to_csv(tmp_file_path, temp_dir)
-                            
-                            if not csv_files:
-                                st.error("No valid messages found in log file")
-                                return
-                            
-                            # Load to database
-                            conn = load_csvs_to_temp_db(csv_files)
-                            
-                            # Get dynamic attributes
-                            dynamic_attrs = get_all_dynamic_attributes(conn)
-                            
-                            if not dynamic_attrs:
-                                st.error("No dynamic attributes found for visualization")
-                                return
-                            
-                            # Store in session state
-                            st.session_state.processed_data = conn
-                            st.session_state.dynamic_attrs = dynamic_attrs
-                            
-                            st.success(f"✅ Processed {len(csv_files)} message types")
-                            
+                        # Parse MAVLink messages straight into the database
+                        conn = create_temp_db()
+                        row_counts = parse_mavlink_to_sqlite(tmp_file_path, conn)
+                        
+                        if not row_counts:
+                            st.error("No valid messages found in log file")
+                            return
+                        
+                        # Get dynamic attributes
+                        dynamic_attrs = get_all_dynamic_attributes(conn)
+                        
+                        if not dynamic_attrs:
+                            st.error("No dynamic attributes found for visualization")
+                            return
+                        
+                        # Reruns may run on other threads, so keep a thread-safe
+                        # read-only connection; it also keeps the database alive
+                        st.session_state.processed_data = open_readonly_db(conn.uri, conn.row_counts)
+                        st.session_state.dynamic_attrs = dynamic_attrs
+                        st.session_state.gps_cols = {}
+                        st.session_state.db_id = conn.uri
+                        
+                        # The database is frozen from here on, so summarize it once
+                        st.session_state.schema = get_database_schema(conn)
+                        st.session_state.total_attrs = sum(
+                            len(attrs['attributes']) for attrs in dynamic_attrs.values()
+                        )
+                        conn.close()
+                        
+                        st.success(f"✅ Processed {len(row_counts)} message types")
+                        
                         # Clean up temp file
                         os.unlink(tmp_file_path)
                         
@@ -374,26 +541,54 @@ def main():
                     
                     # Performance controls
                     st.subheader("⚡ Performance")
-                    max_records = st.slider(
-                        "Max records to plot:",
-                        min_value=100,
-                        max_value=20000,
-                        value=5000,
+                    points_per_trace = st.slider(
+                        "Points per trace:",
+                        min_value=500,
+                        max_value=10000,
+                        value=2000,
                         step=500,
-                        help="Limit records for better performance"
+                        help="Each trace is downsampled to this many points, keeping its shape"
                     )
                     
+                    # Zoom window: re-queried and re-downsampled, so detail grows as it narrows
+                    time_window = None
+                    time_bounds = get_time_bounds(conn, selected_message)
+                    if time_bounds and time_bounds[1] > time_bounds[0]:
+                        time_scale = 1e-6 if 'timeus' in msg_attrs['time_col'].lower() else 1.0
+                        full_window = (time_bounds[0] * time_scale, time_bounds[1] * time_scale)
+                        selected_window = st.slider(
+                            "🔍 Time window (s):" if time_scale != 1.0 else "🔍 Time window:",
+                            min_value=full_window[0],
+                            max_value=full_window[1],
+                            value=full_window,
+                            format="%.1f",
+                            help="Narrow the window to reload that slice at full resolution"
+                        )
+                        if selected_window != full_window:
+                            time_window = (selected_window[0] / time_scale,
+                                           selected_window[1] / time_scale)
+                    
                     # Chart type selection
                     st.subheader("📈 Chart Types")
                     show_timeseries = st.checkbox("Time Series", value=True)
                     show_scatter = st.checkbox("Scatter Matrix", value=False)
+                    interactive_scatter = True
+                    if show_scatter:
+                        interactive_scatter = st.checkbox(
+                            "Interactive scatter matrix",
+                            value=len(selected_attributes) <= 3 and msg_attrs['row_count'] <= 1000,
+                            help="Off draws an even sample of the rows as a static density image, "
+                                 "which stays light in the browser for many points"
+                        )
                     show_trajectory = st.checkbox("3D Trajectory", value=False)
                     show_distribution = st.checkbox("Distributions", value=False)
             
             # Generate visualizations
             if selected_message and selected_attributes:
-                # Get chart data
-                chart_data = get_chart_data(conn, selected_message, selected_attributes, max_records)
+                # Get chart data for just the plotted columns
+                needed_cols = [attr for attr in selected_attributes if attr in msg_attrs['attributes']]
+                chart_data = load_chart_data(conn, st.session_state.db_id, selected_message,
+                                             tuple(needed_cols), time_window)
                 
                 if 'error' not in chart_data:
                     # Display parameter info
@@ -414,21 +609,27 @@ def main():
                     # Time Series Chart
                     if show_timeseries:
                         st.subheader("📈 Time Series Analysis")
-                        fig_ts = create_time_series_chart(chart_data, selected_attributes, selected_message)
+                        fig_ts = create_time_series_chart(chart_data, selected_attributes, selected_message,
+                                                          points_per_trace)
                         if fig_ts:
                             st.plotly_chart(fig_ts, use_container_width=True)
                     
                     # Scatter Matrix
                     if show_scatter and len(selected_attributes) >= 2:
                         st.subheader("🔗 Parameter Correlations")
-                        fig_scatter = create_scatter_matrix(chart_data, selected_attributes)
-                        if fig_scatter:
-                            st.plotly_chart(fig_scatter, use_container_width=True)
+                        if interactive_scatter:
+                            fig_scatter = create_scatter_matrix(chart_data, selected_attributes)
+                            if fig_scatter:
+                                st.plotly_chart(fig_scatter, use_container_width=True)
+                        else:
+                            scatter_png = create_scatter_matrix_image(chart_data, selected_attributes)
+                            if scatter_png:
+                                st.image(scatter_png, caption="Point density per parameter pair over an even sample of rows (darker = more samples)")
                     
                     # 3D Trajectory
                     if show_trajectory:
                         st.subheader("🗺️ Flight Trajectory")
-                        fig_3d = create_3d_trajectory(chart_data)
+                        fig_3d = create_3d_trajectory(chart_data, msg_attrs['attributes'])
                         if fig_3d:
                             st.plotly_chart(fig_3d, use_container_width=True)
                         else:
@@ -443,7 +644,7 @@ def main():
                     
                     # Statistics
                     st.subheader("📈 Statistical Summary")
-                    stats = calculate_data_statistics(conn, selected_message, selected_attributes)
+                    stats = chart_data['stats']
                     if 'error' not in stats:
                         stats_df = pd.DataFrame(stats).T
                         st.dataframe(stats_df.round(3), use_container_width=True)
@@ -455,7 +656,7 @@ def main():
             st.header("📤 Data Export")
             
             # Show available tables
-            schema = get_database_schema(conn)
+            schema = st.session_state.schema
             
             st.subheader("Available Message Types")
             export_options = []
@@ -495,7 +696,7 @@ def main():
             st.header("ℹ️ Log Information")
             
             # Display schema information
-            schema = get_database_schema(conn)
+            schema = st.session_state.schema
             
             st.subheader("📋 Message Types Summary")
             summary_data = []
@@ -522,8 +723,7 @@ def main():
             with col3:
                 st.metric("Plottable Types", len(dynamic_attrs))
             with col4:
-                total_attrs = sum(len(attrs['attributes']) for attrs in dynamic_attrs.values())
-                st.metric("Dynamic Parameters", total_attrs)
+                st.metric("Dynamic Parameters", st.session_state.total_attrs)
             
             # Detailed table information
             st.subheader("📊 Detailed Table Information")
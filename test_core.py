@@ -0,0 +1,124 @@
+import array
+
+import pytest
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+from core import (
+    append_column_value,
+    create_temp_db,
+    get_chart_data,
+    infer_units_and_descriptions,
+    load_csvs_to_temp_db,
+    parse_all_mavlink_messages_to_csv,
+    parse_mavlink_to_sqlite,
+    write_table_batches
+)
+
+
+def write_tlog(path, messages):
+    """Write messages as a .tlog (8-byte timestamp before each packet)."""
+    mav = mavlink.MAVLink(None, srcSystem=1)
+    with open(path, 'wb') as f:
+        for i, msg in enumerate(messages):
+            f.write((1_700_000_000_000_000 + i * 100_000).to_bytes(8, 'big'))
+            f.write(msg.pack(mav))
+
+
+def test_parse_keeps_uint64_above_int64_range(tmp_path):
+    log_path = tmp_path / 'large_uid.tlog'
+    uid = 2**63 + 12345
+    attitudes = [
+        mavlink.MAVLink_attitude_message(i * 100, 0.1 * i, 0.2, 0.3, 0.0, 0.0, 0.0)
+        for i in range(20)
+    ]
+    version = mavlink.MAVLink_autopilot_version_message(
+        0, 1, 2, 3, 4, [0] * 8, [0] * 8, [0] * 8, 0, 0, uid
+    )
+    write_tlog(log_path, attitudes[:10] + [version] + attitudes[10:])
+
+    conn = create_temp_db()
+    row_counts = parse_mavlink_to_sqlite(str(log_path), conn)
+
+    assert row_counts['ATTITUDE'] == 20
+    assert row_counts['AUTOPILOT_VERSION'] == 1
+    stored_uid, = conn.execute("SELECT uid FROM AUTOPILOT_VERSION").fetchone()
+    assert stored_uid == float(uid)
+
+
+def test_parquet_round_trip_keeps_uint64_above_int64_range(tmp_path):
+    log_path = tmp_path / 'large_uid.tlog'
+    uid = 2**63 + 5
+    attitudes = [
+        mavlink.MAVLink_attitude_message(i * 100, 0.1 * i, 0.2, 0.3, 0.0, 0.0, 0.0)
+        for i in range(5)
+    ]
+    version = mavlink.MAVLink_autopilot_version_message(
+        0, 1, 2, 3, 4, [0] * 8, [0] * 8, [0] * 8, 0, 0, uid
+    )
+    write_tlog(log_path, attitudes + [version])
+
+    parquet_files = parse_all_mavlink_messages_to_csv(str(log_path), str(tmp_path), sink='parquet')
+    conn = load_csvs_to_temp_db(parquet_files)
+
+    assert conn.row_counts['ATTITUDE'] == 5
+    assert conn.row_counts['AUTOPILOT_VERSION'] == 1
+    stored_uid, = conn.execute("SELECT uid FROM AUTOPILOT_VERSION").fetchone()
+    assert stored_uid == float(uid)
+
+
+def test_failed_table_load_rolls_back_to_previous_table():
+    conn = create_temp_db()
+    conn.execute("CREATE TABLE X (a INTEGER)")
+    conn.execute("INSERT INTO X VALUES (99)")
+    conn.commit()
+
+    with pytest.raises(OverflowError):
+        write_table_batches(conn, 'X', '[a] INTEGER', "INSERT INTO [X] VALUES (?)",
+                            [[(1,), (2,)], [(2**64,)]])
+
+    assert conn.execute("SELECT a FROM X").fetchall() == [(99,)]
+
+
+def test_chart_data_reads_full_window_or_even_stride(tmp_path):
+    log_path = tmp_path / 'spike.tlog'
+    attitudes = [
+        mavlink.MAVLink_attitude_message(i * 100, 5.0 if i == 777 else 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        for i in range(2000)
+    ]
+    write_tlog(log_path, attitudes)
+
+    conn = create_temp_db()
+    parse_mavlink_to_sqlite(str(log_path), conn)
+
+    full = get_chart_data(conn, 'ATTITUDE', ['roll'], max_points=None)['data']
+    assert len(full) == 2000
+    assert full['roll'].max() == 5.0
+
+    # Downsampling is a plain stride, so extremes are not over-represented
+    sampled = get_chart_data(conn, 'ATTITUDE', ['roll'], max_points=100)['data']
+    assert len(sampled) == 100
+    assert (sampled['time_boot_ms'].diff().dropna() == 2000).all()
+
+
+@pytest.mark.parametrize('column, expected', [
+    ('rollspeed', ('deg/s', 'Roll angular velocity')),
+    ('Temp', ('°C', 'Temperature')),
+    ('ThrOut', ('%', 'Throttle')),
+    ('RelHomeAlt', ('meters', 'Altitude')),
+    ('relative_alt', ('meters', 'Altitude')),
+    ('Lat', ('degrees', 'Latitude')),
+    ('R', ('deg/s', 'Yaw rate')),
+])
+def test_infer_units_prefers_earlier_patterns(column, expected):
+    assert infer_units_and_descriptions(column) == expected
+
+
+def test_typed_column_buffer_falls_back_to_list():
+    buffers = [array.array('h'), array.array('h')]
+    for i, val in enumerate((1, 2)):
+        append_column_value(buffers, i, val)
+
+    append_column_value(buffers, 0, 1.5)
+    append_column_value(buffers, 1, 2**40)
+
+    assert buffers == [[1, 1.5], [2, 2**40]]